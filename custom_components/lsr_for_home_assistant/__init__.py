@@ -1,5 +1,5 @@
 # Version: 1.3.0
-# pylint: disable=import-error,mixed-line-endings,line-too-long
+# pylint: disable=import-error,mixed-line-endings,line-too-long,unused-argument
 """Initialization module for the LSR integration.
 
 This module sets up the LSR integration by handling config entries, coordinators,
@@ -12,6 +12,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 from .const import DOMAIN
+from .api_client import clear_meter_history_cache
 from .coordinator import LSRDataUpdateCoordinator, _coerce_scan_interval
 
 PLATFORMS = [Platform.SENSOR, Platform.BUTTON, Platform.CAMERA, Platform.NUMBER]
@@ -53,6 +54,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle removal of a config entry.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant instance.
+        entry (ConfigEntry): The removed configuration entry.
+    """
+    # Кэш истории переживает перезагрузку записи — чистим его только при удалении
+    clear_meter_history_cache(entry.entry_id)
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options updates."""
     coordinator_instance = hass.data.get(DOMAIN, {}).get(entry.entry_id)
@@ -4,16 +4,69 @@
 This module provides functions to handle API requests to https://mp.lsr.ru/api/rpc.
 """
 
-import aiohttp
 import asyncio
-import logging
 import hashlib
-from typing import Dict, List, Any
+import logging
+import time
+from typing import Dict, List, Any, Tuple
+
+import aiohttp
 
 from .const import API_URL, NAMESPACE
 
 _LOGGER = logging.getLogger(__name__)
 
+# Сколько запросов истории показаний отправляем одновременно, чтобы не упереться в лимиты API
+_HISTORY_CONCURRENCY = 8
+
+# История показаний только дополняется: держим её в памяти,
+# пока не изменилось последнее показание счётчика
+# Дольше максимального интервала опроса (12 ч), иначе кэш не переживёт ни одного цикла
+_HISTORY_CACHE_TTL = 24 * 3600  # секунд
+# (entry_id, account_id) → meter_id → (время загрузки, последнее показание, история).
+# Переживает перезагрузку записи; удаляется только вместе с самой записью
+_HISTORY_CACHE: Dict[Tuple[str, str], Dict[str, Tuple[float, Tuple, List[Dict]]]] = {}
+
+def clear_meter_history_cache(entry_id: str) -> None:
+    """Drop cached meter histories of all accounts of a config entry.
+
+    Args:
+        entry_id (str): The ID of the removed config entry.
+    """
+    for cache_key in [key for key in _HISTORY_CACHE if key[0] == entry_id]:
+        del _HISTORY_CACHE[cache_key]
+
+def _split_cached_histories(
+    cache_key: Tuple[str, str],
+    meters: List[Dict]
+) -> Tuple[Dict[str, Tuple], List[Tuple]]:
+    """Split account meters into valid cache entries and meters whose history must be fetched.
+
+    Args:
+        cache_key (Tuple[str, str]): The (config entry ID, account ID) pair of the meters.
+        meters (List[Dict]): Meter data as returned by get_meters.
+
+    Returns:
+        Tuple[Dict[str, Tuple], List[Tuple]]: Valid cache entries by meter ID and
+        (meter ID, fingerprint) pairs to fetch.
+    """
+    cached_histories = _HISTORY_CACHE.get(cache_key, {})
+    now = time.monotonic()
+    valid = {}
+    stale = []
+    for meter in meters:
+        meter_id = (meter.get("objectId") or {}).get("id")
+        if not meter_id:
+            continue
+        last_meter_value = meter.get("lastMeterValue") or {}
+        fingerprint = (last_meter_value.get("dateList"), last_meter_value.get("listValue"))
+        cached = cached_histories.get(meter_id)
+        if cached and cached[1] == fingerprint and now - cached[0] < _HISTORY_CACHE_TTL:
+            valid[meter_id] = cached
+        else:
+            stale.append((meter_id, fingerprint))
+    return valid, stale
+
 async def authenticate(
     session: aiohttp.ClientSession,
     username: str,
@@ -229,7 +282,7 @@ async def get_cameras(session: aiohttp.ClientSession, access_token: str, account
                 raise aiohttp.ClientError(f"Failed to get camera list: Status code {data.get('statusCode')}")
             cameras = data["data"].get("cameras", [])
             for camera in cameras:
-                camera["preview"] = camera.get("preview", "").split("?")[0]
+                camera["preview"] = camera.get("preview", "").partition("?")[0]
             return cameras
     except aiohttp.ClientError as err:
         _LOGGER.error("Error fetching camera list for %s: %s", account_id, err)
@@ -252,10 +305,11 @@ async def get_camera_stream_url(session: aiohttp.ClientSession, camera: Dict, he
         _LOGGER.debug("No videoUrl provided for camera %s, setting stream_url to empty", camera.get("id", "unknown"))
         return
 
-    curl_command = f"curl -v '{video_url}'"
-    for header, value in headers.items():
-        curl_command += f" -H \"{header}: {value}\""
-    _LOGGER.debug("cURL command for camera %s: %s", camera.get("id", "unknown"), curl_command)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        curl_command = f"curl -v '{video_url}'"
+        for header, value in headers.items():
+            curl_command += f" -H \"{header}: {value}\""
+        _LOGGER.debug("cURL command for camera %s: %s", camera.get("id", "unknown"), curl_command)
 
     try:
         async with session.get(video_url, headers=headers, timeout=10) as video_resp:
@@ -398,6 +452,50 @@ async def get_meter_history(session: aiohttp.ClientSession, access_token: str, m
         _LOGGER.error("Error fetching meter history for %s: %s", meter_id, err)
         raise
 
+async def get_meters_and_histories(
+    session: aiohttp.ClientSession,
+    access_token: str,
+    account_id: str,
+    entry_id: str
+) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+    """Get meters for a specific account together with their reading histories.
+
+    History requests for all meters are issued concurrently over the shared session
+    as soon as the meter list arrives, at most _HISTORY_CONCURRENCY at a time. A history
+    fetched less than _HISTORY_CACHE_TTL seconds ago is reused while the meter's last
+    reading is unchanged.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the requests.
+        access_token (str): The access token for authentication.
+        account_id (str): The ID of the account to retrieve meters for.
+        entry_id (str): The ID of the config entry the account belongs to.
+
+    Returns:
+        Tuple[List[Dict], Dict[str, List[Dict]]]: List of meter data and history items
+        keyed by meter ID.
+
+    Raises:
+        aiohttp.ClientError: If any of the API requests fails.
+    """
+    meters = await get_meters(session, access_token, account_id)
+    cache_key = (entry_id, account_id)
+    account_cache, stale = _split_cached_histories(cache_key, meters)
+
+    semaphore = asyncio.Semaphore(_HISTORY_CONCURRENCY)
+
+    async def fetch_history(meter_id: str) -> List[Dict]:
+        async with semaphore:
+            return await get_meter_history(session, access_token, meter_id)
+
+    fetched = await asyncio.gather(*(fetch_history(meter_id) for meter_id, _ in stale))
+    fetched_at = time.monotonic()
+    for (meter_id, fingerprint), history_items in zip(stale, fetched):
+        account_cache[meter_id] = (fetched_at, fingerprint, history_items)
+    # Кэш аккаунта заменяем целиком — записи удалённых счётчиков не накапливаются
+    _HISTORY_CACHE[cache_key] = account_cache
+    return meters, {meter_id: entry[2] for meter_id, entry in account_cache.items()}
+
 async def get_communal_requests(session: aiohttp.ClientSession, access_token: str, account_id: str) -> List[Dict]:
     """Get a list of communal requests for a specific account.
 
@@ -17,7 +17,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     """Set up the LSR button platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = []
-    for account_id in coordinator.data.keys():
+    for account_id in coordinator.data:
         entities.append(LSRForceUpdateButton(coordinator, account_id))
     async_add_entities(entities)
     _LOGGER.debug("Added button entities")
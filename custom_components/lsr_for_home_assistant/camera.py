@@ -9,7 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 
-from .const import DOMAIN
+from .const import DOMAIN, ENTITY_ID_TRANS, account_entity_key, build_account_device_info
 from .coordinator import LSRDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,8 +31,9 @@ async def async_setup_entry(
     entities = []
 
     for account_id, account_data in coordinator.data.items():
-        personal_account_number = account_data.get("personal_account_number", "unknown")
-        entity_suffix = personal_account_number if personal_account_number != "unknown" else account_id[-8:]
+        entity_key = account_entity_key(account_id, account_data)
+        # Общий DeviceInfo для всех камер аккаунта
+        device_info = build_account_device_info(account_id, account_data)
 
         # Add existing cameras
         for camera in account_data.get("cameras", []):
@@ -46,7 +47,9 @@ async def async_setup_entry(
                 _LOGGER.warning("Invalid or missing preview_url for camera %s (account %s)", camera.get("id"),
                                 account_id)
                 preview_url = None
-            entity_id = f"camera.lsr_{entity_suffix}_camera_{camera['id']}".lower().replace("-", "_")
+            # id камеры — ASCII-идентификатор API, поэтому хватает ENTITY_ID_TRANS
+            entity_id = (f"camera.lsr_{entity_key}_camera_"
+                         f"{str(camera['id']).translate(ENTITY_ID_TRANS)}")
             entities.append(
                 LSRCamera(
                     coordinator,
@@ -57,13 +60,14 @@ async def async_setup_entry(
                     preview_url,
                     entity_id,
                     entity_id,
+                    device_info,
                 )
             )
 
         # Add main pass QR camera
         main_pass = account_data.get("main_pass", {})
         if main_pass and main_pass.get("qr"):
-            qr_entity_id = f"camera.lsr_{entity_suffix}_mainpass_qr".lower().replace("-", "_")
+            qr_entity_id = f"camera.lsr_{entity_key}_mainpass_qr"
             entities.append(
                 LSRMainPassQRCamera(
                     coordinator,
@@ -72,6 +76,7 @@ async def async_setup_entry(
                     main_pass.get("text", ""),
                     qr_entity_id,
                     qr_entity_id,
+                    device_info,
                 )
             )
 
@@ -94,6 +99,7 @@ class LSRCamera(Camera):
             preview_url: str | None,
             entity_id: str,
             unique_id: str,
+            device_info: DeviceInfo,
     ) -> None:
         """Initialize the camera."""
         super().__init__()
@@ -108,13 +114,7 @@ class LSRCamera(Camera):
         self._preview_url = preview_url
         self._attr_preload_stream = True
         self._stream = None
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._account_id)},
-            name=coordinator.data.get(self._account_id, {}).get("account_title",
-                                                                f"ЛСР Аккаунт {self._account_id[-8:]}"),
-            manufacturer="ЛСР",
-            model="Communal Account",
-        )
+        self._attr_device_info = device_info
         self._attr_entity_registry_enabled_default = False
         _LOGGER.debug(
             "Initialized camera %s with unique_id %s, entity_id=%s, stream_url: %s",
@@ -284,6 +284,7 @@ class LSRMainPassQRCamera(Camera):
             text: str,
             entity_id: str,
             unique_id: str,
+            device_info: DeviceInfo,
     ) -> None:
         """Initialize the QR camera."""
         super().__init__()
@@ -296,13 +297,7 @@ class LSRMainPassQRCamera(Camera):
         self._attr_name = "СКУД QR-код"
         self._attr_has_entity_name = False
         self._attr_preload_stream = False
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._account_id)},
-            name=coordinator.data.get(self._account_id, {}).get("account_title",
-                                                                f"ЛСР Аккаунт {self._account_id[-8:]}"),
-            manufacturer="ЛСР",
-            model="Communal Account",
-        )
+        self._attr_device_info = device_info
         self._attr_entity_registry_enabled_default = False
         _LOGGER.debug(
             "Initialized QR camera %s with unique_id %s, entity_id=%s, qr_url: %s",
@@ -5,12 +5,59 @@ This module defines constants such as domain, API URL, namespace, and default sc
 along with a transliteration function for converting Russian text to Latin for unique IDs.
 """
 
+from homeassistant.helpers.entity import DeviceInfo
+
 DOMAIN = "lsr_for_home_assistant"
 API_URL = "https://mp.lsr.ru/api/rpc"
 # noinspection HttpUrlsUsage
 NAMESPACE = "http://www.lsr.ru/estate/headlessCMS"
 DEFAULT_SCAN_INTERVAL = 43200  # 12 часов в секундах
 
+# Нормализация фрагментов entity_id за один проход: A-Z → a-z, "-" → "_".
+# Только ASCII: в отличие от str.lower() не трогает кириллицу, поэтому применять лишь
+# к идентификаторам API и цифрам
+ENTITY_ID_TRANS = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ-",
+    "abcdefghijklmnopqrstuvwxyz_",
+)
+
+
+def account_entity_key(account_id: str, account_data: dict) -> str:
+    """Build the normalized account part of entity IDs.
+
+    Args:
+        account_id (str): The account ID.
+        account_data (dict): Coordinator data of the account.
+
+    Returns:
+        str: Personal account number (or the account ID tail) normalized for entity IDs.
+    """
+    personal_account_number = account_data.get("personal_account_number", "unknown")
+    entity_suffix = (personal_account_number if personal_account_number != "unknown"
+                     else account_id[-8:])
+    # ENTITY_ID_TRANS только ASCII: безопасно, т.к. personal_account_number — цифры л/с
+    # или (если л/с не распознан) account_id[-8:], но никогда не русский текст
+    return str(entity_suffix).translate(ENTITY_ID_TRANS)
+
+
+def build_account_device_info(account_id: str, account_data: dict) -> DeviceInfo:
+    """Build the device shared by all entities of an account.
+
+    Args:
+        account_id (str): The account ID.
+        account_data (dict): Coordinator data of the account.
+
+    Returns:
+        DeviceInfo: Device info of the account.
+    """
+    return DeviceInfo(
+        identifiers={(DOMAIN, account_id)},
+        name=account_data.get("account_title", f"ЛСР Аккаунт {account_id[-8:]}"),
+        manufacturer="ЛСР",
+        model="Communal Account",
+    )
+
+
 def transliterate(text: str) -> str:
     """Transliterate Russian text to Latin for unique_id.
 
@@ -27,8 +27,7 @@ from .api_client import (
     get_account_data,
     get_cameras,
     get_communal_requests,
-    get_meters,
-    get_meter_history,
+    get_meters_and_histories,
     get_camera_stream_url,
 )
 
@@ -36,6 +35,13 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SCAN_INTERVAL = timedelta(hours=12)
 
+_DATE_RE = re.compile(r"^(\d{2})\.(\d{2})\.(\d{4})$")
+_COMMA_TO_DOT = str.maketrans(",", ".")
+_POVERKA_DATE_RE = re.compile(r"\s*(\d{2}\.\d{2}\.\d{4})\.*")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_ADDRESS_SPAN_RE = re.compile(r"<span[^>]*>(.*?)</span>", re.DOTALL)
+_PERSONAL_ACCOUNT_RE = re.compile(r"Л/с №(\d+)")
+
 
 def _coerce_scan_interval(raw_value) -> timedelta:
     """Normalize scan interval value to timedelta.
@@ -59,15 +65,27 @@ def _coerce_scan_interval(raw_value) -> timedelta:
     return DEFAULT_SCAN_INTERVAL
 
 
+def _parse_reading(value: str) -> float:
+    """Parse a meter reading with either decimal separator; copy the string only if it has a comma."""
+    return float(value.translate(_COMMA_TO_DOT) if "," in value else value)
+
+
+def _parse_ddmmyyyy(value: str):
+    """Parse a dd.mm.yyyy date without strptime; return None if it does not match."""
+    match = _DATE_RE.match(value or "")
+    if not match:
+        return None
+    try:
+        return datetime(int(match[3]), int(match[2]), int(match[1]))
+    except ValueError:
+        return None
+
+
 def _parse_account_fields(account: Dict, account_id: str) -> Dict:
     """Parse address and account identifiers from account payload."""
     try:
-        addr_match = re.search(
-            r"<span[^>]*>(.*?)</span>",
-            account["customFields"]["rows"][0]["cells"][0]["value"],
-            re.DOTALL,
-        )
-        ls_match = re.search(r"Л/с №(\d+)", account["objectId"]["title"])
+        addr_match = _ADDRESS_SPAN_RE.search(account["customFields"]["rows"][0]["cells"][0]["value"])
+        ls_match = _PERSONAL_ACCOUNT_RE.search(account["objectId"]["title"])
 
         parsed_address = addr_match.group(1).strip() if addr_match else "Адрес не распознан"
         parsed_personal_account = ls_match.group(1) if ls_match else "Л/с не найден"
@@ -110,18 +128,17 @@ def _extract_poverka_date(meter: Dict):
     cells = rows[2].get("cells", [])
     if not cells:
         return None
-    cell_value = cells[0].get("value", "")
-    if not cell_value:
+    cell_value = cells[0].get("value") or ""
+    if ":" not in cell_value:
         return None
-    clean_text = re.sub(r"<[^>]+>", "", cell_value).strip()
-    if ":" not in clean_text:
+    clean_text = _HTML_TAG_RE.sub("", cell_value).strip()
+    colon = clean_text.find(":")
+    if colon < 0:
         return None
-    parts = clean_text.split(":", 1)
-    if len(parts) != 2:
-        return None
-    date_part = parts[1].strip().rstrip(".")
-    if re.match(r"^\d{2}\.\d{2}\.\d{4}$", date_part):
-        return date_part
+    # Дата должна занимать весь текст после двоеточия (допускаются точка и пробелы)
+    match = _POVERKA_DATE_RE.fullmatch(clean_text, colon + 1)
+    if match and _parse_ddmmyyyy(match[1]) is not None:
+        return match[1]
     return None
 
 
@@ -317,17 +334,23 @@ class LSRDataUpdateCoordinator(DataUpdateCoordinator):
             include_guest_passes: bool = False,
     ) -> Dict:
         """Fetch account data with optional inclusions."""
-
-        account_data = await get_account_data(self.session, self.access_token, account_id)
-        communal_requests = await get_communal_requests(self.session, self.access_token, account_id)
-        meters_data = await get_meters(self.session, self.access_token, account_id)
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        # Независимые запросы выполняем параллельно
+        account_data, communal_requests, (meters_data, histories) = await asyncio.gather(
+            get_account_data(self.session, self.access_token, account_id),
+            get_communal_requests(self.session, self.access_token, account_id),
+            get_meters_and_histories(
+                self.session, self.access_token, account_id, self.entry.entry_id
+            ),
+        )
 
         # -------- МЕТРЫ --------
         meters_history = {}
 
         for meter in meters_data:
-            poverka_date = "Не указана"
-            _LOGGER.debug("meter: %s", meter)
+            if debug_enabled:
+                _LOGGER.debug("meter: %s", meter)
 
             object_id = meter.get("objectId")
             if not object_id:
@@ -339,35 +362,35 @@ class LSRDataUpdateCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("Meter without id skipped: %s", meter)
                 continue
 
-            history_items = await get_meter_history(self.session, self.access_token, meter_id)
-
-            history_dict = {}
-
-            for history_item in history_items:
-                value_raw = history_item.get("value1", {}).get("value")
-                date_str = history_item.get("dateList")
-
-                if value_raw and date_str:
-                    history_dict[date_str] = float(value_raw.replace(",", "."))
+            # История уже получена вместе со списком счётчиков
+            history_items = histories.get(meter_id, [])
+            poverka_date = "Не указана"
+            history_dict = {
+                history_item["dateList"]: _parse_reading(history_item["value1"]["value"])
+                for history_item in history_items
+                if history_item.get("dateList") and history_item.get("value1", {}).get("value")
+            }
 
-            last_value_raw = meter.get("lastMeterValue", {}).get("listValue")
-            last_date = meter.get("lastMeterValue", {}).get("dateList")
+            last_meter_value = meter.get("lastMeterValue", {})
+            last_value_raw = last_meter_value.get("listValue")
+            last_date = last_meter_value.get("dateList")
 
             if last_value_raw and last_date:
-                history_dict[last_date] = float(last_value_raw.replace(",", "."))
+                history_dict[last_date] = _parse_reading(last_value_raw)
 
             # Дата поверки
             poverka_date = _extract_poverka_date(meter) or poverka_date
-            if poverka_date != "Не указана":
+            if debug_enabled and poverka_date != "Не указана":
                 _LOGGER.debug("Найдена дата поверки для %s: %s", meter_id, poverka_date)
 
+            meter_type = meter.get("type", {})
             meters_history[meter_id] = {
                 "title": object_id.get("title", "Unknown"),
-                "type_id": meter.get("type", {}).get("id"),
-                "type_title": meter.get("type", {}).get("title"),
+                "type_id": meter_type.get("id"),
+                "type_title": meter_type.get("title"),
                 "history": sorted(
                     history_dict.items(),
-                    key=lambda x: datetime.strptime(x[0], "%d.%m.%Y"),
+                    key=lambda x: _parse_ddmmyyyy(x[0]) or datetime.min,
                 ),
                 "poverka_date": poverka_date
             }
@@ -398,7 +421,7 @@ class LSRDataUpdateCoordinator(DataUpdateCoordinator):
                     if cells and len(cells) > 0:
                         value = cells[0].get("value", "")
                         if value:
-                            clean = re.sub(r"<[^>]+>", "", value).strip()
+                            clean = _HTML_TAG_RE.sub("", value).strip()
                             payment_status = clean
                             _LOGGER.debug("Найден payment_status: %s", payment_status)
                             break
@@ -419,12 +442,13 @@ class LSRDataUpdateCoordinator(DataUpdateCoordinator):
                 for camera in cameras:
                     if "videoUrl" in camera and camera["videoUrl"]:
                         await get_camera_stream_url(self.session, camera, headers)
-                        _LOGGER.debug(
-                            "Camera %s (%s): videoUrl → stream_url = %s",
-                            camera.get("id"),
-                            camera.get("title"),
-                            camera.get("stream_url", "<empty>")
-                        )
+                        if debug_enabled:
+                            _LOGGER.debug(
+                                "Camera %s (%s): videoUrl → stream_url = %s",
+                                camera.get("id"),
+                                camera.get("title"),
+                                camera.get("stream_url", "<empty>")
+                            )
                     else:
                         _LOGGER.warning("Camera %s has no videoUrl", camera.get("id"))
 
@@ -26,7 +26,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     """Set up the LSR number platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities = []
-    for account_id in coordinator.data.keys():
+    for account_id in coordinator.data:
         entities.append(LSRScanIntervalNumber(hass, entry, account_id, coordinator))
     async_add_entities(entities)
     _LOGGER.debug("Added number entities")
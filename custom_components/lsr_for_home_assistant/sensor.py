@@ -4,46 +4,242 @@
 # pylint: disable=line-too-long,mixed-line-endings
 """Custom component for LSR integration, providing sensor entities."""
 
+import asyncio
 import logging
 import re
+from collections import Counter
+from functools import partial
 from datetime import datetime
 from typing import Union, Callable
 # noinspection PyProtectedMember
 from homeassistant.components.sensor import SensorEntity, EntityCategory
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import SensorStateClass, SensorDeviceClass
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, ENTITY_ID_TRANS, account_entity_key, build_account_device_info
 from .coordinator import LSRDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+_STATE_CLASS_CACHE = {sc.value: sc for sc in SensorStateClass}
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_DIGITS = "0123456789"
+_ACCRUAL_AMOUNT_RE = re.compile(r"Начислено\s*([\d.,]+)")
+_ACCRUAL_ANY_AMOUNT_RE = re.compile(r"([\d]+[.,]\d+)")
+
+# № → N, пробелы → подчёркивания (для ключей атрибутов счётчиков)
+_SAFE_KEY_TRANS = str.maketrans({"№": "N", " ": "_"})
+
+# Значения по умолчанию для базовых сенсоров, если в данных аккаунта нет ключа
+_NUMERIC_DEFAULT = 999
+_STRING_DEFAULT = "STRING_DEFAULT"
+# Состояние СКУД, если у основного пропуска нет ПИН-кода
+_NO_PIN = "Нет пина"
+
+# Базовые сенсоры аккаунта; name совпадает с ключом в данных аккаунта, default — числовой либо строковый
+_SENSOR_TYPES = {
+    "address": {"name": "address", "friendly_name": "Адрес", "icon": "mdi:home", "state_class": None},
+    "personal-account-number": {"name": "personal_account_number", "friendly_name": "№ л/с",
+                                "icon": "mdi:card-account-details-outline", "state_class": None},
+    "payment-status": {"name": "payment_status", "friendly_name": "Статус оплаты", "icon": "mdi:cash",
+                       "state_class": None},
+    "notification-count": {"name": "notification_count", "friendly_name": "Уведомления", "icon": "mdi:bell",
+                           "state_class": "measurement", "default": _NUMERIC_DEFAULT},
+    "camera-count": {"name": "camera_count", "icon": "mdi:camera", "state_class": "measurement",
+                     "default": _NUMERIC_DEFAULT},
+    "last-refresh": {"name": "last_refresh", "friendly_name": "Время последнего опроса",
+                     "icon": "mdi:clock-check", "state_class": None,
+                     "device_class": SensorDeviceClass.TIMESTAMP}
+}
+
+# Статус заявки, который считает каждый сенсор communalrequest-count-*
+_REQUEST_STATUS_BY_TYPE = {
+    "communalrequest-count-done": "Done",
+    "communalrequest-count-atwork": "AtWork",
+    "communalrequest-count-onhold": "OnHold",
+    "communalrequest-count-waitingforregistration": "WaitingForRegistration",
+}
+
+# Настройки счётчика по типу: unit и device_class сенсора показаний — только стандартные для HA,
+# attribute_unit — русская единица для атрибутов сенсора meter-count; неизвестные типы — без единиц
+_METER_TYPE_CONFIG = {
+    "HotWater": {"unit": "m³", "device_class": SensorDeviceClass.VOLUME, "attribute_unit": "м³"},
+    "ColdWater": {"unit": "m³", "device_class": SensorDeviceClass.VOLUME, "attribute_unit": "м³"},
+    "Heating": {"unit": "Gcal", "device_class": SensorDeviceClass.ENERGY, "attribute_unit": "Гкал"},
+    "Electricity": {"unit": "kWh", "device_class": SensorDeviceClass.ENERGY},
+}
+
+# Сенсоры с целочисленным состоянием (счётчики)
+_INT_SENSOR_TYPES = frozenset({
+    "notification-count",
+    "camera-count",
+    "meter-count",
+    "communalrequest-count-total",
+    "communalrequest-count-done",
+    "communalrequest-count-atwork",
+    "communalrequest-count-onhold",
+    "communalrequest-count-waitingforregistration",
+    "guestpass",
+})
+
 
 def _strip_html(text: str) -> str:
-    return re.sub(r"<[^>]+>", "", text or "")
+    return _HTML_TAG_RE.sub("", text or "")
 
 
-def _extract_amount_from_accrual(accrual) -> float:
-    """Extract начислено amount from listFields; return 0.0 if not found."""
-    rows = accrual.get("listFields", {}).get("rows", [])
+def _extract_amount_from_rows(rows) -> float:
+    """Extract начислено amount from listFields rows in a single pass; return 0.0 if not found."""
+    fallback = None
     for row in rows:
         for cell in row.get("cells", []):
-            text = _strip_html(cell.get("value", "")).strip()
-            match = re.search(r"Начислено\s*([\d.,]+)", text)
-            if match:
-                return float(match.group(1).replace(",", "."))
-    # Fallback: first numeric value in listFields (if format changes)
-    for row in rows:
-        for cell in row.get("cells", []):
-            text = _strip_html(cell.get("value", "")).strip()
-            match = re.search(r"([\d]+[.,]\d+)", text)
-            if match:
-                return float(match.group(1).replace(",", "."))
-    return 0.0
+            value = cell.get("value", "")
+            if not value:
+                continue
+            # Дешёвая проверка подстроки до удаления HTML-тегов
+            if "Начислено" in value:
+                match = _ACCRUAL_AMOUNT_RE.search(_strip_html(value))
+                if match:
+                    return float(match.group(1).replace(",", "."))
+            if fallback is None:
+                # Fallback: first numeric value in listFields (if format changes)
+                match = _ACCRUAL_ANY_AMOUNT_RE.search(_strip_html(value))
+                if match:
+                    fallback = float(match.group(1).replace(",", "."))
+    return fallback if fallback is not None else 0.0
+
+
+def _extract_amount_from_accrual(accrual) -> float:
+    """Extract начислено amount from listFields; return 0.0 if not found."""
+    return _extract_amount_from_rows(accrual.get("listFields", {}).get("rows", []))
+
+
+def _parse_accrual(accrual) -> tuple[str, float]:
+    """Return the (month label, accrued amount) pair for a single accrual."""
+    rows = accrual.get("listFields", {}).get("rows") or [{}]
+    cells = rows[0].get("cells") or [{}]
+    date_text = _strip_html(cells[0].get("value", "")).strip()
+    return date_text, _extract_amount_from_rows(rows)
+
+
+def _parse_accruals(accruals) -> tuple[float, dict]:
+    """Parse accruals once into the latest amount and per-month attributes.
+
+    Returns:
+        tuple[float, dict]: Amount of the latest accrual and a mapping like {"Декабрь 2025": "1234,56 ₽"}.
+    """
+    amount = 0.0
+    attributes = {}
+    for index, accrual in enumerate(accruals):
+        date_text, amount_value = _parse_accrual(accrual)
+        if index == 0:
+            amount = amount_value
+        amount_str = f"{amount_value:.2f}".replace(".", ",") if amount_value else "0"
+        attributes[date_text] = f"{amount_str} ₽"
+    return amount, attributes
+
+
+def _format_pass_date(timestamp) -> str:
+    """Format a unix timestamp as dd.mm.yyyy without going through strftime."""
+    date = datetime.fromtimestamp(timestamp)
+    return f"{date.day:02d}.{date.month:02d}.{date.year}"
+
+
+def _to_int(value) -> int:
+    return int(value) if value is not None else 998
+
+
+def _to_rounded_float(value) -> float:
+    return round(float(value) if value is not None else 0.0, 4)
+
+
+def _to_timestamp(value):
+    if isinstance(value, str):
+        parsed = dt_util.parse_datetime(value)
+        return parsed if parsed is not None else value
+    return value
+
+
+def _to_str(value) -> str:
+    return str(value) if value is not None else "Unknown"
+
+
+def _format_guest_passes(guest_passes_data) -> list:
+    """Format guest passes as "Тип | дд.мм.гггг–дд.мм.гггг | Пин: … | QR: …" strings."""
+    return [
+        f"{pass_data['strategy']['title']} | "
+        f"{_format_pass_date(pass_data['dateFrom'])}–{_format_pass_date(pass_data['dateTo'])} | "
+        f"Пин: {pass_data.get('pin', '—')} | "
+        f"QR: {pass_data.get('qr', '—')}"
+        for pass_data in guest_passes_data.get("items", ())
+    ]
+
+
+def _build_skud_attributes(main_pass, guest_passes_data) -> dict:
+    """Build the СКУД sensor attributes from the main pass and guest passes payloads."""
+    return {
+        "guest_passes_count": guest_passes_data.get("count", 0),
+        "guest_passes": _format_guest_passes(guest_passes_data),
+        "main_pass_text": main_pass.get("text", ""),
+        "main_pass_qr": main_pass.get("qr", ""),
+    }
+
+
+def _add_sensor(
+        entities: list,
+        hass: HomeAssistant,
+        coordinator: LSRDataUpdateCoordinator,
+        account_id: str,
+        entity_key: str,
+        device_info: DeviceInfo,
+        sensor_type: str,
+        state,
+        name: str,
+        icon: str,
+        id_suffix: str = None,
+        **kwargs,
+) -> None:
+    """Append an account's LSRSensor built with the shared entity id template and device.
+
+    Args:
+        entities (list): Per-account list the sensor is appended to.
+        hass (HomeAssistant): The Home Assistant instance.
+        coordinator (LSRDataUpdateCoordinator): The data coordinator for the integration.
+        account_id (str): The account ID associated with the sensor.
+        entity_key (str): Normalized account part of the entity ID.
+        device_info (DeviceInfo): Shared device info of the account.
+        sensor_type (str): The type of the sensor.
+        state: The initial state of the sensor.
+        name (str): The entity name key of the sensor.
+        icon (str): The icon for the sensor.
+        id_suffix (str, optional): Entity ID suffix; defaults to the name.
+        **kwargs: Other LSRSensor keyword arguments; unique_id defaults to the entity ID.
+    """
+    entity_id = f"sensor.lsr_{entity_key}_{id_suffix or name}"
+    kwargs.setdefault("unique_id", entity_id)
+    entities.append(
+        LSRSensor(
+            hass,
+            coordinator,
+            account_id,
+            sensor_type,
+            state,
+            name,
+            icon,
+            entity_id=entity_id,
+            device_info=device_info,
+            **kwargs
+        )
+    )
+
+
+def _count_request_statuses(communal_requests) -> Counter:
+    """Count communal requests by status id in a single pass."""
+    return Counter(req.get("status", {}).get("id") for req in communal_requests)
 
 
 async def async_setup_entry(
@@ -59,71 +255,43 @@ async def async_setup_entry(
         async_add_entities (Callable[[list], None]): Callback to add entities to Home Assistant.
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-
-    sensor_types = {
-        "address": {"name": "address", "friendly_name": "Адрес", "icon": "mdi:home", "state_class": None},
-        "personal-account-number": {"name": "personal_account_number", "friendly_name": "№ л/с",
-                                    "icon": "mdi:card-account-details-outline", "state_class": None},
-        "payment-status": {"name": "payment_status", "friendly_name": "Статус оплаты", "icon": "mdi:cash",
-                           "state_class": None},
-        "notification-count": {"name": "notification_count", "friendly_name": "Уведомления", "icon": "mdi:bell",
-                               "state_class": "measurement"},
-        "camera-count": {"name": "camera_count", "icon": "mdi:camera", "state_class": "measurement"},
-        "last-refresh": {"name": "last_refresh", "friendly_name": "Время последнего опроса",
-                         "icon": "mdi:clock-check", "state_class": None,
-                         "device_class": SensorDeviceClass.TIMESTAMP}
-    }
+    entity_count = 0
+    # Проверяем уровень один раз: отладочные аргументы (repr словарей) дорогие
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
     for account_id, account_data in coordinator.data.items():
-        _LOGGER.debug("=== Данные аккаунта %s ===", account_id)
-        _LOGGER.debug("Все доступные ключи: %s", sorted(account_data.keys()))
-        _LOGGER.debug("address          → %s", account_data.get("address"))
-        _LOGGER.debug("personal_account_number → %s", account_data.get("personal_account_number"))
-        _LOGGER.debug("payment_status   → %s", account_data.get("payment_status"))
-        _LOGGER.debug("notification_count → %s", account_data.get("notification_count"))
-        _LOGGER.debug("Полный account_data (первые 1000 символов): %s", str(account_data))
-
-        numeric_default = 999  # для всех счётчиков и числовых сенсоров — нормальный дефолт 0
-        string_default = "STRING_DEFAULT"
-
-        personal_account_number = account_data.get("personal_account_number", "unknown")
-        entity_suffix = personal_account_number if personal_account_number != "unknown" else account_id[-8:]
-
-        for sensor_type, config in sensor_types.items():
-            key = sensor_type.replace("-", "_")
-            if sensor_type == "meter-count":
-                # Специально считаем реальное количество из "meters"
-                meters = account_data.get("meters", {})
-                state = len(meters)
-                _LOGGER.debug("Реальное количество счётчиков для %s: %d (найдено %d ключей в meters)",
-                              account_id, state, len(meters))
-            else:
-                # Для остальных — обычный get с правильным дефолтом
-                state = account_data.get(
-                    key,
-                    numeric_default if sensor_type in ["notification-count", "camera-count"] else string_default
-                )
-
-            entity_id = f"sensor.lsr_{entity_suffix}_{sensor_type}".lower().replace("-", "_")
-            unique_id = entity_id
-            friendly_name = config.get("friendly_name", config["name"])
-            entities.append(
-                LSRSensor(
-                    hass,
-                    coordinator,
-                    account_id,
-                    sensor_type,
-                    state,
-                    config["name"],
-                    config["icon"],
-                    entity_id=entity_id,
-                    unique_id=unique_id,
-                    state_class=config.get("state_class"),
-                    friendly_name=friendly_name,
-                    device_class=config.get("device_class"),
-                    data_key=config["name"]
-                )
+        entities = []
+        if debug_enabled:
+            _LOGGER.debug("=== Данные аккаунта %s ===", account_id)
+            _LOGGER.debug("Все доступные ключи: %s", sorted(account_data.keys()))
+            _LOGGER.debug("address          → %s", account_data.get("address"))
+            _LOGGER.debug("personal_account_number → %s", account_data.get("personal_account_number"))
+            _LOGGER.debug("payment_status   → %s", account_data.get("payment_status"))
+            _LOGGER.debug("notification_count → %s", account_data.get("notification_count"))
+            _LOGGER.debug("Полный account_data (первые 1000 символов): %.1000s", account_data)
+
+        # Одно устройство на аккаунт — общий DeviceInfo для всех его сенсоров
+        device_info = build_account_device_info(account_id, account_data)
+        # Нормализуем один раз на аккаунт, чтобы не делать это для каждой сущности
+        entity_key = account_entity_key(account_id, account_data)
+
+        # Общие для всех сенсоров аккаунта аргументы связываем явно, а не через замыкание в цикле
+        add_sensor = partial(_add_sensor, entities, hass, coordinator, account_id, entity_key, device_info)
+
+        for sensor_type, config in _SENSOR_TYPES.items():
+            key = config["name"]
+            # meter-count создаётся ниже из уже полученного meters, здесь — обычный get с дефолтом из таблицы
+            state = account_data.get(key, config.get("default", _STRING_DEFAULT))
+
+            add_sensor(
+                sensor_type,
+                state,
+                key,
+                config["icon"],
+                state_class=config.get("state_class"),
+                friendly_name=config.get("friendly_name", key),
+                device_class=config.get("device_class"),
+                data_key=key
             )
 
         # Sensors for meters
@@ -135,141 +303,102 @@ async def async_setup_entry(
             "count": meter_count,
         }
 
+        # По одному сенсору на каждый счётчик; атрибуты для meter-count собираем в том же проходе
         for meter_id, meter_data in meters.items():
+            if debug_enabled:
+                _LOGGER.debug("meter_id %s: %s", meter_id, meter_data)
             title = meter_data.get("title", "Без названия")
+            type_id = meter_data.get("type_id")
+
+            # Тип счётчика для атрибутов
+            meter_type_title = meter_data.get("type_title", "Неизвестно")
 
-            # Текущее значение
+            # Дата последнего показания и чистое значение (float) из последней записи истории
             history = meter_data.get("history", [])
-            current_value = history[-1][1] if history else 0.0
+            last_date, current_value = history[-1] if history else ("Неизвестно", 0.0)
 
-            # Единицы измерения
-            unit = "м³" if meter_data.get("type_id") in ("HotWater", "ColdWater") else \
-                "Гкал" if meter_data.get("type_id") == "Heating" else ""
+            # Настройки типа счётчика ищем один раз: и для атрибута meter-count, и для сенсора показаний
+            meter_config = _METER_TYPE_CONFIG.get(type_id, {})
+            attr_unit = meter_config.get("attribute_unit", "")
 
             # Формируем безопасный ключ: убираем №, пробелы → подчёркивания, приводим к нижнему регистру
-            safe_key = (
-                title.replace("№", "N")
-                .replace(" ", "_")
-                .replace("№", "")
-                .lower()
-            )
+            safe_key = title.translate(_SAFE_KEY_TRANS).lower()
 
             # Добавляем атрибут вида meter_хвс_на_гвс_8358216 = "126.1608 м³"
-            extra_attributes[f"meter_{safe_key}"] = f"{current_value:.4f} {unit}"
-
-        # Создаём сенсор
-        meter_count_entity_id = f"sensor.lsr_{entity_suffix}_meter_count".lower().replace("-", "_")
-        entities.append(
-            LSRSensor(
-                hass,
-                coordinator,
-                account_id,
-                "meter-count",
-                meter_count,
-                "meter_count",
-                "mdi:counter",
-                entity_id=meter_count_entity_id,
-                unique_id=meter_count_entity_id,
-                state_class="measurement",
-                unit_of_measurement="шт",
-                friendly_name="Счётчиков всего",
-                extra_attributes=extra_attributes,
-                data_key="meters"
-            )
-        )
+            extra_attributes[f"meter_{safe_key}"] = f"{current_value:.4f} {attr_unit}"
 
-        # 2. По одному сенсору на каждый счётчик
-        for meter_id, meter_data in meters.items():
-            _LOGGER.debug("meter_id %s: %s", meter_id, meter_data)
-            title = meter_data.get("title", "Без названия")
-
-            # Извлекаем чистый номер и тип для имени
-            meter_number_match = re.search(r"№(\d+)", title)
-            meter_number = meter_number_match.group(1) if meter_number_match else meter_id[-8:]
+            # Извлекаем чистый номер и тип для имени: цифры сразу после «№» без регулярных выражений
+            title_head, _, title_tail = title.partition("№")
+            number_length = len(title_tail) - len(title_tail.lstrip(_DIGITS))
+            meter_number = title_tail[:number_length] if number_length else meter_id[-8:]
 
             # Обрезаем всё после номера → получаем "ХВС на ГВС", "ХВС", "Отопление"
-            prefix = re.sub(r"№\d+.*", "", title).strip()
+            prefix = (title_head if number_length else title).strip()
             if not prefix:
                 prefix = meter_data.get("type_title", "Счётчик").split()[-1]  # fallback
 
             # Имя: "Счётчик ХВС на ГВС №8358216"
             friendly_name = f"Счётчик {prefix} №{meter_number}"
 
-            # Чистое значение (float)
-            history = meter_data.get("history", [])
-            current_value = history[-1][1] if history else 0.0
-
-            # Единицы измерения — только стандартные для HA!
-            unit = None
-            device_class = None
+            # Единицы измерения — из той же записи таблицы; показания всегда накопительные
+            unit = meter_config.get("unit")
+            device_class = meter_config.get("device_class")
             state_class = "total_increasing"
-
-            type_id = meter_data.get("type_id")
-            if type_id in ("HotWater", "ColdWater"):
-                unit = "m³"  # ← английская "m³"
-                device_class = SensorDeviceClass.VOLUME
-                state_class = "total_increasing"  # ← накопительное значение!
-            elif type_id == "Heating":
-                unit = "Gcal"  # ← стандартная для Гкал
-                device_class = SensorDeviceClass.ENERGY
-                state_class = "total_increasing"
-            elif type_id == "Electricity":
-                unit = "kWh"
-                device_class = SensorDeviceClass.ENERGY
-                state_class = "total_increasing"
-            _LOGGER.debug("meter unit_of_measurement %s: type_id=%s, unit=%s, device_class=%s, state_class=%s",
-                          meter_id, type_id, unit, device_class, state_class)
-
-            # Тип счётчика для атрибутов
-            meter_type_title = meter_data.get("type_title", "Неизвестно")
+            if debug_enabled:
+                _LOGGER.debug("meter unit_of_measurement %s: type_id=%s, unit=%s, device_class=%s, state_class=%s",
+                              meter_id, type_id, unit, device_class, state_class)
 
             # Дата поверки из координатора!
             poverka_date = meter_data.get("poverka_date", "Не указана")
 
-            # Дата последнего показания
-            last_date = "Неизвестно"
-            if history:
-                last_date = history[-1][0]
-
             # Уникальное имя сущности
-            base_entity_id = f"lsr_{entity_suffix}_meter_{meter_number}".lower().replace("-", "_")
-
-            entities.append(
-                LSRSensor(
-                    hass,
-                    coordinator,
-                    account_id,
-                    f"meter-{meter_id}-value",
-                    current_value,  # ← только число!
-                    f"meter_{meter_number}_value",
-                    "mdi:gauge",
-                    entity_id=f"sensor.{base_entity_id}_value",
-                    unique_id=f"{base_entity_id}_value",
-                    state_class=state_class,
-                    unit_of_measurement=unit,  # ← единицы здесь!
-                    device_class=device_class,
-                    friendly_name=friendly_name,  # ← "Счётчик ХВС на ГВС №8358216"
-                    extra_attributes={
-                        "poverka_date": poverka_date,
-                        "last_update": last_date,
-                        "meter_type": meter_type_title,
-                        "meter_id": meter_id,
-                        "title": title,
-                    },
-                    meter_id=meter_id
-                )
+            # Номер из названия — только цифры; нормализовать нужно лишь хвост meter_id (ASCII-идентификатор API)
+            meter_key = meter_number if number_length else meter_number.translate(ENTITY_ID_TRANS)
+
+            add_sensor(
+                f"meter-{meter_id}-value",
+                current_value,  # ← только число!
+                f"meter_{meter_number}_value",
+                "mdi:gauge",
+                id_suffix=f"meter_{meter_key}_value",
+                unique_id=f"lsr_{entity_key}_meter_{meter_key}_value",
+                state_class=state_class,
+                unit_of_measurement=unit,  # ← единицы здесь!
+                device_class=device_class,
+                friendly_name=friendly_name,  # ← "Счётчик ХВС на ГВС №8358216"
+                extra_attributes={
+                    "poverka_date": poverka_date,
+                    "last_update": last_date,
+                    "meter_type": meter_type_title,
+                    "meter_id": meter_id,
+                    "title": title,
+                },
+                meter_id=meter_id
             )
 
+        # Создаём сенсор meter-count после прохода по счётчикам
+        add_sensor(
+            "meter-count",
+            meter_count,
+            "meter_count",
+            "mdi:counter",
+            state_class="measurement",
+            unit_of_measurement="шт",
+            friendly_name="Счётчиков всего",
+            extra_attributes=extra_attributes,
+            data_key="meters"
+        )
+
         # Sensors for communal requests
         communal_requests = account_data.get("communal_requests", [])
         total_requests = len(communal_requests)
 
         # Считаем по статусам
-        done_count = len([req for req in communal_requests if req.get("status", {}).get("id") == "Done"])
-        atwork_count = len([req for req in communal_requests if req.get("status", {}).get("id") == "AtWork"])
-        onhold_count = len([req for req in communal_requests if req.get("status", {}).get("id") == "OnHold"])
-        waiting_count = len(
-            [req for req in communal_requests if req.get("status", {}).get("id") == "WaitingForRegistration"])
+        status_counts = _count_request_statuses(communal_requests)
+        done_count = status_counts.get("Done", 0)
+        atwork_count = status_counts.get("AtWork", 0)
+        onhold_count = status_counts.get("OnHold", 0)
+        waiting_count = status_counts.get("WaitingForRegistration", 0)
 
         # Словарь с локализованными названиями и иконками
         request_sensors = [
@@ -321,77 +450,41 @@ async def async_setup_entry(
         ]
 
         for req_sensor in request_sensors:
-            entity_id = f"sensor.lsr_{entity_suffix}_{req_sensor['name']}".lower().replace("-", "_")
-            entities.append(
-                LSRSensor(
-                    hass,
-                    coordinator,
-                    account_id,
-                    req_sensor["type"],
-                    req_sensor["count"],
-                    req_sensor["name"],
-                    req_sensor["icon"],
-                    entity_id=entity_id,
-                    unique_id=entity_id,
-                    state_class="measurement",
-                    friendly_name=req_sensor["friendly_name"],
-                    extra_attributes=req_sensor.get("extra_attributes")
-                )
+            add_sensor(
+                req_sensor["type"],
+                req_sensor["count"],
+                req_sensor["name"],
+                req_sensor["icon"],
+                state_class="measurement",
+                friendly_name=req_sensor["friendly_name"],
+                extra_attributes=req_sensor.get("extra_attributes")
             )
 
-            if req_sensor["type"] != "communalrequest-count-total":
-                continue
-
-            # New sensor for payment due
-            amount = 0.0
-            extra_attributes = {
-                "account_id": account_id,
-                "sensor_type": "payment-due"
-            }
-            accruals = account_data.get("accruals", [])
-            if accruals:
+        # New sensor for payment due
+        amount = 0.0
+        extra_attributes = {
+            "account_id": account_id,
+            "sensor_type": "payment-due"
+        }
+        accruals = account_data.get("accruals", [])
+        if accruals:
+            if debug_enabled:
                 _LOGGER.debug("accruals: %s", accruals)
 
-                # Берём только валидные начисления
-                latest_accrual = accruals[0]
-
-                # ---------- Сумма последнего начисления ----------
-                amount = _extract_amount_from_accrual(latest_accrual)
-
-                # ---------- Красивые атрибуты: месяц + сумма в нужном формате ----------
-                for accrual in accruals:
-                    # Дата начисления (из первой ячейки первой строки)
-                    date_cell = accrual["listFields"]["rows"][0]["cells"][0]["value"]
-                    date_text = re.sub(r"<[^>]+>", "", date_cell).strip()
-
-                    # Сумма начисления (из второй ячейки первой строки)
-                    amount_value = _extract_amount_from_accrual(accrual)
-                    amount_str = f"{amount_value:.2f}".replace(".", ",") if amount_value else "0"
-
-                    # Формируем ключ вида "Декабрь 2025"
-                    month_year = date_text  # уже "Декабрь 2025" и т.п.
-
-                    extra_attributes[month_year] = f"{amount_str} ₽"
-
-            sensor_payment_due = f"sensor.lsr_{entity_suffix}_payment_due".lower().replace("-", "_")
-
-            entities.append(
-                LSRSensor(
-                    hass,
-                    coordinator,
-                    account_id,
-                    "payment-due",
-                    amount,
-                    "payment_due",
-                    "mdi:cash",
-                    entity_id=sensor_payment_due,
-                    unique_id=sensor_payment_due,
-                    friendly_name="Последнее начисление",
-                    unit_of_measurement="₽",
-                    device_class=SensorDeviceClass.MONETARY,
-                    extra_attributes=extra_attributes
-                )
-            )
+            # Сумма последнего начисления + атрибуты вида "Декабрь 2025": "1234,56 ₽" за один проход
+            amount, accrual_attributes = _parse_accruals(accruals)
+            extra_attributes.update(accrual_attributes)
+
+        add_sensor(
+            "payment-due",
+            amount,
+            "payment_due",
+            "mdi:cash",
+            friendly_name="Последнее начисление",
+            unit_of_measurement="₽",
+            device_class=SensorDeviceClass.MONETARY,
+            extra_attributes=extra_attributes
+        )
 
         # Новый объединённый сенсор СКУД (основан на QR-коде)
         main_pass = account_data.get("main_pass", {})
@@ -399,47 +492,25 @@ async def async_setup_entry(
 
         if main_pass or guest_passes_data:
             # Состояние = ПИН-код (или "Нет пина", если отсутствует)
-            pin_code = main_pass.get("pin", "Нет пина")
-
-            # Формируем красивый список гостевых пропусков для атрибутов
-            guest_list = []
-            guest_count = guest_passes_data.get("count", 0)
-            for pass_data in guest_passes_data.get("items", []):
-                from_date = datetime.fromtimestamp(pass_data['dateFrom']).strftime('%d.%m.%Y')
-                to_date = datetime.fromtimestamp(pass_data['dateTo']).strftime('%d.%m.%Y')
-                pass_str = (
-                    f"{pass_data['strategy']['title']} | "
-                    f"{from_date}–{to_date} | "
-                    f"Пин: {pass_data.get('pin', '—')} | "
-                    f"QR: {pass_data.get('qr', '—')}"
-                )
-                guest_list.append(pass_str)
+            pin_code = main_pass.get("pin", _NO_PIN)
 
             # Создаём сенсор
-            skud_qr_entity_id = f"sensor.lsr_{entity_suffix}_skud".lower().replace("-", "_")
-            entities.append(
-                LSRSensor(
-                    hass,
-                    coordinator,
-                    account_id,
-                    "skud",
-                    pin_code,  # ← состояние = ПИН-код
-                    "skud",
-                    "mdi:qrcode",
-                    entity_id=skud_qr_entity_id,
-                    unique_id=skud_qr_entity_id,
-                    friendly_name="СКУД",
-                    extra_attributes={
-                        "guest_passes_count": guest_count,
-                        "guest_passes": guest_list,
-                        "main_pass_text": main_pass.get("text", ""),
-                        "main_pass_qr": main_pass.get("qr", ""),
-                    }
-                )
+            add_sensor(
+                "skud",
+                pin_code,  # ← состояние = ПИН-код
+                "skud",
+                "mdi:qrcode",
+                friendly_name="СКУД",
+                # Формируем красивый список гостевых пропусков для атрибутов
+                extra_attributes=_build_skud_attributes(main_pass, guest_passes_data)
             )
 
-    async_add_entities(entities)
-    _LOGGER.debug("Added %s sensor entities", len(entities))
+        # Регистрируем сущности аккаунта сразу и отдаём управление циклу событий перед следующим
+        async_add_entities(entities)
+        entity_count += len(entities)
+        await asyncio.sleep(0)
+
+    _LOGGER.debug("Added %s sensor entities", entity_count)
 
 
 class LSRSensor(CoordinatorEntity, SensorEntity):
@@ -448,6 +519,31 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
     This class handles the creation and management of sensor entities for the LSR integration.
     """
 
+    # Сенсоры, отключённые по умолчанию
+    _DISABLED_BY_DEFAULT = frozenset({
+        "communalrequest-count-done",
+        "communalrequest-count-atwork",
+        "communalrequest-count-onhold",
+        "communalrequest-count-waitingforregistration",
+        "meter-count",
+        "last-refresh",
+    })
+
+    # Распределение по категориям Home Assistant (None — видимый сенсор)
+    _CATEGORY_MAP = {
+        "mainpass-pin": None,
+        "guestpass": None,
+        "payment-status": None,
+        "address": None,
+        "personal-account-number": None,
+        "communalrequest-count-total": EntityCategory.DIAGNOSTIC,
+        "notification-count": EntityCategory.DIAGNOSTIC,
+        "camera-count": EntityCategory.DIAGNOSTIC,
+        "payment-due": EntityCategory.DIAGNOSTIC,
+        "last-refresh": EntityCategory.DIAGNOSTIC,
+    }
+    _DIAGNOSTIC_PREFIXES = ("communalrequest-count-", "meter-")
+
     def __init__(
             self,
             hass: HomeAssistant,
@@ -459,6 +555,7 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
             icon: str,
             entity_id: str,
             unique_id: str,
+            device_info: DeviceInfo,
             state_class: str = None,
             _entity_category: EntityCategory = None,
             unit_of_measurement: str = None,
@@ -481,6 +578,7 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
             icon (str): The icon for the sensor.
             entity_id (str): The entity ID for the sensor.
             unique_id (str): The unique ID for the sensor.
+            device_info (DeviceInfo): Shared device info of the account.
             state_class (str, optional): The state class of the sensor.
             entity_category (EntityCategory, optional): The category of the sensor.
             unit_of_measurement (str, optional): The unit of measurement for the sensor.
@@ -500,74 +598,72 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = icon
         self._attr_device_class = device_class
         self._attr_native_unit_of_measurement = unit_of_measurement
-        if state_class:
-            try:
-                self._attr_state_class = SensorStateClass(state_class)
-            except ValueError:
-                _LOGGER.warning("Invalid state_class %s for %s", state_class, unique_id)
+        cached_state_class = _STATE_CLASS_CACHE.get(state_class)
+        if cached_state_class:
+            self._attr_state_class = cached_state_class
+        elif state_class:
+            _LOGGER.warning("Invalid state_class %s for %s", state_class, unique_id)
         self._attr_has_entity_name = False
-        self._attr_extra_state_attributes = extra_attributes or {}
+        # Статичная часть атрибутов собирается один раз; остальное добавляется при обновлении координатора
+        self._base_attributes = {
+            "account_id": account_id,
+            "sensor_type": sensor_type,
+            **(extra_attributes or {}),
+        }
         self._state = state if state is not None else (
-            0 if sensor_type in ["notification-count", "camera-count", "meter-count", "communalrequest-count-total",
-                                 "communalrequest-count-done", "communalrequest-count-atwork",
-                                 "communalrequest-count-onhold", "communalrequest-count-waitingforregistration",
-                                 "guestpass"] else "Unknown")
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._account_id)},
-            name=coordinator.data.get(self._account_id, {}).get("account_title",
-                                                                f"ЛСР Аккаунт {self._account_id[-8:]}"),
-            manufacturer="ЛСР",
-            model="Communal Account",
-        )
+            0 if sensor_type in _INT_SENSOR_TYPES else "Unknown")
+        self._attr_device_info = device_info
         # Автоматическое распределение по категориям + отключение по умолчанию
-        if self._sensor_type in [
-            "communalrequest-count-done",
-            "communalrequest-count-atwork",
-            "communalrequest-count-onhold",
-            "communalrequest-count-waitingforregistration",
-            "meter-count",
-            "last-refresh",
-        ]:
-            self._attr_entity_registry_enabled_default = False  # ← отключены по умолчанию
+        self._attr_entity_registry_enabled_default = sensor_type not in self._DISABLED_BY_DEFAULT
+        if sensor_type in self._CATEGORY_MAP:
+            self._attr_entity_category = self._CATEGORY_MAP[sensor_type]
+        elif sensor_type.startswith(self._DIAGNOSTIC_PREFIXES):
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
         else:
-            self._attr_entity_registry_enabled_default = True
-
-        # Автоматическое распределение по категориям Home Assistant
-        visible_types = {
-            "mainpass-pin", "guestpass",
-            "payment-status",
-            "address", "personal-account-number"
-        }
-
-        diagnostic_types = {
-            "communalrequest-count-total",
-            "notification-count", "camera-count",
-            "payment-due", "last-refresh"
-        }
-
-        diagnostic_prefixes = ("communalrequest-count-", "meter-")
-
-        if self._sensor_type in visible_types:
             self._attr_entity_category = None
 
-        elif (
-            self._sensor_type in diagnostic_types
-            or self._sensor_type.startswith(diagnostic_prefixes)
-        ):
-            self._attr_entity_category = EntityCategory.DIAGNOSTIC
-
+        # Тип сенсора не меняется — выбираем приведение значения один раз
+        if sensor_type in _INT_SENSOR_TYPES:
+            self._convert = _to_int
+        elif sensor_type.endswith("-value") or sensor_type == "payment-due":
+            self._convert = _to_rounded_float
+        elif sensor_type == "last-refresh":
+            self._convert = _to_timestamp
         else:
-            self._attr_entity_category = None
+            self._convert = _to_str
+
+        # Значение и доступность считаем один раз здесь и затем только при обновлении координатора
+        account_data = coordinator.data.get(self._account_id)
+        self._attr_available = account_data is not None
+        self._attr_native_value = self._compute_native_value(account_data)
+        self._attr_extra_state_attributes = self._compute_extra_attributes(account_data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the cached state when the coordinator delivers new data."""
+        account_data = self._coordinator.data.get(self._account_id)
+        # Доступность меняется только с данными координатора — храним в атрибуте вместо свойства
+        self._attr_available = account_data is not None
+        # Данные аккаунта ищем один раз за обновление и передаём в расчёт значения и атрибутов
+        self._attr_native_value = self._compute_native_value(account_data)
+        if self._sensor_type == "skud" and account_data is not None:
+            # Атрибуты СКУД меняются только вместе с данными — собираем здесь, а не при каждом чтении
+            self._base_attributes.update(_build_skud_attributes(
+                account_data.get("main_pass", {}),
+                account_data.get("guest_passes", {}),
+            ))
+        self._attr_extra_state_attributes = self._compute_extra_attributes(account_data)
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available.
 
         Returns:
-            bool: True if the account data is available, false otherwise.
+            bool: True if the account is present in coordinator data.
         """
-        is_available = self._coordinator.data.get(self._account_id) is not None
-        return is_available
+        # CoordinatorEntity.available не читает _attr_available, поэтому переопределяем
+        return self._attr_available
 
     @property
     def name(self):
@@ -584,29 +680,27 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
             return "Количество уведомлений"
         return self._attr_name
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor.
+    def _compute_native_value(self, account_data):
+        """Compute the state of the sensor from coordinator data.
+
+        Args:
+            account_data (dict | None): Coordinator data of the sensor's account, None if it is missing.
 
         Returns:
             Union[str, int, float]: The current state of the sensor, rounded to 4 decimal places for values.
         """
-        account_data = self._coordinator.data.get(self._account_id, {})
-
-        if self._sensor_type == "meter-count":
+        if account_data is None:
+            # Аккаунт пропал из данных — сенсор недоступен, держим последнее известное состояние
+            state = self._state
+        elif self._sensor_type == "meter-count":
             state = len(account_data.get("meters", {}))
         elif self._sensor_type.startswith("communalrequest-count-"):
             communal_requests = account_data.get("communal_requests", [])
+            status_id = _REQUEST_STATUS_BY_TYPE.get(self._sensor_type)
             if self._sensor_type == "communalrequest-count-total":
                 state = len(communal_requests)
-            elif self._sensor_type == "communalrequest-count-done":
-                state = len([req for req in communal_requests if req.get("status", {}).get("id") == "Done"])
-            elif self._sensor_type == "communalrequest-count-atwork":
-                state = len([req for req in communal_requests if req.get("status", {}).get("id") == "AtWork"])
-            elif self._sensor_type == "communalrequest-count-onhold":
-                state = len([req for req in communal_requests if req.get("status", {}).get("id") == "OnHold"])
-            elif self._sensor_type == "communalrequest-count-waitingforregistration":
-                state = len([req for req in communal_requests if req.get("status", {}).get("id") == "WaitingForRegistration"])
+            elif status_id:
+                state = sum(1 for req in communal_requests if req.get("status", {}).get("id") == status_id)
             else:
                 state = 0
         elif self._sensor_type == "payment-due":
@@ -615,7 +709,7 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
             state = amount
         elif self._sensor_type == "skud":
             main_pass = account_data.get("main_pass", {})
-            state = main_pass.get("pin", "РќРµС‚ РїРёРЅР°")
+            state = main_pass.get("pin", _NO_PIN)
         elif self._sensor_type.endswith("-value") and self._meter_id:
             meter_data = account_data.get("meters", {}).get(self._meter_id, {})
             history = meter_data.get("history", [])
@@ -623,37 +717,23 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
         else:
             key = self._data_key if self._data_key else self._sensor_type
             state = account_data.get(key, self._state)
-        if self._sensor_type in ["notification-count", "camera-count", "meter-count", "communalrequest-count-total",
-                                 "communalrequest-count-done", "communalrequest-count-atwork",
-                                 "communalrequest-count-onhold", "communalrequest-count-waitingforregistration",
-                                 "guestpass"]:
-            state = int(state) if state is not None else 998
-        elif self._sensor_type.endswith("-value") or self._sensor_type == "payment-due":
-            state = round(float(state) if state is not None else 0.0, 4)
-        elif self._sensor_type == "last-refresh":
-            if isinstance(state, str):
-                parsed = dt_util.parse_datetime(state)
-                state = parsed if parsed is not None else state
-        elif self._sensor_type.startswith("meter-") and "-poverka" not in self._sensor_type:
-            state = str(state) if state is not None else "Unknown"
-        else:
-            state = str(state) if state is not None else "Unknown"
-        _LOGGER.debug("Sensor %s native_value: %s", self._attr_unique_id, state)
+        state = self._convert(state)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sensor %s native_value: %s", self._attr_unique_id, state)
         return state
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes.
+    def _compute_extra_attributes(self, account_data):
+        """Compute the state attributes from the static part and coordinator data.
+
+        Args:
+            account_data (dict | None): Coordinator data of the sensor's account, None if it is missing.
 
         Returns:
             dict: Additional attributes for the sensor entity.
         """
-        account_data = self._coordinator.data.get(self._account_id, {})
-        base_attributes = {
-            "account_id": self._account_id,
-            "sensor_type": self._sensor_type,
-            **self._attr_extra_state_attributes,
-        }
+        if account_data is None:
+            account_data = {}
+        base_attributes = dict(self._base_attributes)
         last_refresh = account_data.get("last_refresh")
         if last_refresh:
             base_attributes["last_refresh"] = last_refresh
@@ -669,18 +749,8 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
                 "last_update": last_date,
             })
         if self._sensor_type == "payment-due":
-            accruals = account_data.get("accruals", [])
-            extra_attributes = {
-                "account_id": self._account_id,
-                "sensor_type": "payment-due",
-            }
-            for accrual in accruals:
-                date_cell = accrual["listFields"]["rows"][0]["cells"][0]["value"]
-                date_text = _strip_html(date_cell).strip()
-                amount_value = _extract_amount_from_accrual(accrual)
-                amount_str = f"{amount_value:.2f}".replace(".", ",") if amount_value else "0"
-                extra_attributes[date_text] = f"{amount_str} ₽"
-            base_attributes.update(extra_attributes)
+            _, accrual_attributes = _parse_accruals(account_data.get("accruals", []))
+            base_attributes.update(accrual_attributes)
         elif self._sensor_type == "camera-count":
             cameras = account_data.get("cameras", [])
             for camera in cameras:
@@ -689,32 +759,11 @@ class LSRSensor(CoordinatorEntity, SensorEntity):
                 if title and frame_url:
                     base_attributes[title] = frame_url
         elif self._sensor_type == "communalrequest-count-total":
-            communal_requests = account_data.get("communal_requests", [])
-            base_attributes.update({
-                "done": len([req for req in communal_requests if req.get("status", {}).get("id") == "Done"]),
-                "atwork": len([req for req in communal_requests if req.get("status", {}).get("id") == "AtWork"]),
-                "onhold": len([req for req in communal_requests if req.get("status", {}).get("id") == "OnHold"]),
-                "waiting": len([req for req in communal_requests if req.get("status", {}).get("id") == "WaitingForRegistration"]),
-            })
-        elif self._sensor_type == "skud":
-            main_pass = account_data.get("main_pass", {})
-            guest_passes_data = account_data.get("guest_passes", {})
-            guest_list = []
-            guest_count = guest_passes_data.get("count", 0)
-            for pass_data in guest_passes_data.get("items", []):
-                from_date = datetime.fromtimestamp(pass_data['dateFrom']).strftime('%d.%m.%Y')
-                to_date = datetime.fromtimestamp(pass_data['dateTo']).strftime('%d.%m.%Y')
-                pass_str = (
-                    f"{pass_data['strategy']['title']} | "
-                    f"{from_date}вЂ“{to_date} | "
-                    f"РџРёРЅ: {pass_data.get('pin', 'вЂ”')} | "
-                    f"QR: {pass_data.get('qr', 'вЂ”')}"
-                )
-                guest_list.append(pass_str)
+            status_counts = _count_request_statuses(account_data.get("communal_requests", []))
             base_attributes.update({
-                "guest_passes_count": guest_count,
-                "guest_passes": guest_list,
-                "main_pass_text": main_pass.get("text", ""),
-                "main_pass_qr": main_pass.get("qr", ""),
+                "done": status_counts.get("Done", 0),
+                "atwork": status_counts.get("AtWork", 0),
+                "onhold": status_counts.get("OnHold", 0),
+                "waiting": status_counts.get("WaitingForRegistration", 0),
             })
         return base_attributes